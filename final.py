@@ -1,12 +1,17 @@
 from __future__ import annotations
+import re
+import sys
+from array import array
 from dataclasses import dataclass
-from typing import List, Optional, Set, Dict, Any
+from functools import lru_cache
+from types import ModuleType
+from typing import List, Optional, Set, FrozenSet, Dict, Any, Callable, Final, cast, final
 
 
 # =========================
 # Token + Error
 # =========================
-@dataclass
+@dataclass(slots=True)  # no per-instance __dict__: tokens are created in bulk
 class Token:
     type: str     # KW, IDENT, INT, FLOAT, STRING, OP, SEP, EOF
     value: str
@@ -17,6 +22,27 @@ class Token:
         return f"{self.type}({self.value!r})@{self.line}:{self.col}"
 
 
+@dataclass
+class TokenStream:
+    """
+    Structure-of-arrays token list: token k is
+    (types[k], values[k], lines[k], cols[k]).
+    """
+    types: List[str]
+    values: List[str]
+    lines: array[int]
+    cols: array[int]
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def tokens(self) -> List[Token]:
+        """
+        The same stream as a list of Token objects.
+        """
+        return list(map(Token, self.types, self.values, self.lines, self.cols))
+
+
 class LexerError(Exception):
     pass
 
@@ -24,6 +50,76 @@ class LexerError(Exception):
 # =========================
 # Lexer
 # =========================
+# Token kinds used by Lexer.tokenize(); they are the group numbers of
+# Lexer._MASTER_PATTERN, so a master match's lastindex is its kind.
+# WS/LCOM/BCOM come first so "kind <= _K_BCOM" means "skip".
+_K_WS: Final = 1
+_K_LCOM: Final = 2
+_K_BCOM: Final = 3
+_K_BADCOM: Final = 4
+_K_STR: Final = 5
+_K_NUM: Final = 6
+_K_ID: Final = 7
+_K_SEP: Final = 8
+_K_OP: Final = 9
+_K_BAD: Final = 10
+
+
+# re.Pattern.match, for patterns known to match where they are applied
+_Matcher = Callable[..., "re.Match[str]"]
+
+
+def _group_by_first_char(words: List[str]) -> Dict[str, List[str]]:
+    """
+    Groups words by their first character, longest word first.
+    """
+    groups: Dict[str, List[str]] = {}
+    for w in sorted(words, key=len, reverse=True):
+        groups.setdefault(w[0], []).append(w)
+    return groups
+
+
+def _char_kind_table(separators: Set[str], operators: List[str]) -> List[int]:
+    """
+    First-character dispatch for tokenize(): ASCII code -> token kind, or 0
+    when the master pattern has to decide ('/' may open a comment, '&' and
+    '|' only start two-char operators, anything else is an error).
+    """
+    table = [0] * 128
+    for o in range(128):
+        c = chr(o)
+        if c.isspace():
+            table[o] = _K_WS
+        elif c in ("'", '"'):
+            table[o] = _K_STR
+        elif c.isdecimal():
+            table[o] = _K_NUM
+        elif c.isalpha() or c == "_":
+            table[o] = _K_ID
+        elif c in separators:
+            table[o] = _K_SEP
+        elif c in operators and c != "/":
+            table[o] = _K_OP
+    return table
+
+
+@lru_cache(maxsize=None)
+def _numba_scan() -> Optional[ModuleType]:
+    """
+    numba_scan for Lexer.fast_tokenize(), imported on first use (it reads
+    Lexer's tables, and numba is slow to load), or None when numpy/numba or
+    one of their own dependencies is missing.
+    """
+    try:
+        import numba_scan
+    except ImportError as e:
+        if e.name == "numba_scan":  # not next to final.py: a setup bug
+            raise
+        return None
+    return numba_scan
+
+
+@final
 class Lexer:
     """
     Lexical Analyzer:
@@ -32,13 +128,16 @@ class Lexer:
     - builds a simple lexical table (identifiers + constants)
     """
 
-    KEYWORDS: Set[str] = {
+    KEYWORDS: Final[FrozenSet[str]] = frozenset(map(sys.intern, {
         "let", "const", "if", "else", "while", "for",
         "fn", "return", "print", "true", "false", "null"
-    }
+    }))
+    # Length bounds: most identifiers fail this check before being hashed
+    _KW_LEN_MIN: Final = min(map(len, KEYWORDS))
+    _KW_LEN_MAX: Final = max(map(len, KEYWORDS))
 
     # Operators (longest first)
-    OPERATORS = [
+    OPERATORS: Final[List[str]] = [
         "++", "--", "->",                 # added (from common symbol sets + examples like i++)
         "===", "==", "!=", "<=", ">=",
         "+=", "-=", "*=", "/=",
@@ -46,31 +145,90 @@ class Lexer:
         "=", "+", "-", "*", "/", "%", "<", ">", "!"
     ]
 
+    # Operators grouped by first character (longest candidate first)
+    _OP_BY_FIRST: Final = _group_by_first_char(OPERATORS)
+
     # Symbols / separators (punctuation)
-    SEPARATORS: Set[str] = {"(", ")", "{", "}", "[", "]", ",", ";", ":", "."}
+    SEPARATORS: Final[Set[str]] = {"(", ")", "{", "}", "[", "]", ",", ";", ":", "."}
 
     # Comments
-    LINE_COMMENT = "//"
-    BLOCK_COMMENT_START = "/*"
-    BLOCK_COMMENT_END = "*/"
+    LINE_COMMENT: Final = "//"
+    BLOCK_COMMENT_START: Final = "/*"
+    BLOCK_COMMENT_END: Final = "*/"
+
+    # String escapes (anything else keeps its backslash)
+    ESCAPES: Final[Dict[str, str]] = {"n": "\n", "t": "\t", "\\": "\\", "'": "'", '"': '"'}
+
+    # Identifier body: letters, digits, '_' (same set as isalnum() + "_")
+    _IDENT_RE: Final = re.compile(r"\w*")
+    # INT / FLOAT / SCI literal (exponent only if followed by digit or sign+digit)
+    _NUM_RE: Final = re.compile(r"\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
+    # Run of whitespace (\s is the same set as str.isspace())
+    _WS_RE: Final = re.compile(r"\s+")
+    # Any operator, longest first (same order as OPERATORS)
+    _OP_RE: Final = re.compile("|".join(map(re.escape, OPERATORS)))
+    # Run of ordinary string characters (stops at the quote, "\\" or "\0")
+    _STR_BODY: Final = {
+        '"': re.compile(r'[^"\\\0]*'),
+        "'": re.compile(r"[^'\\\0]*"),
+    }
+
+    # Master pattern for tokenize(): one alternative per token class, tried
+    # in order.  The order matters: LCOM/BCOM/BADCOM must come before OP
+    # (all of them start with "/"), and the catch-all BAD must be last.  It
+    # also fixes the group numbers (_K_*).  Strings and unterminated block
+    # comments are only *detected* here and then handed to lex_string() /
+    # skip_comment_if_present().
+    _MASTER_PATTERN: Final = (
+        r"(?P<WS>\s+)"
+        r"|(?P<LCOM>//[^\n]*)"
+        r"|(?P<BCOM>/\*.*?\*/)"
+        r"|(?P<BADCOM>/\*)"
+        r"|(?P<STR>[\"'])"
+        r"|(?P<NUM>\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)"
+        r"|(?P<ID>[^\W\d]\w*)"
+        r"|(?P<SEP>[" + re.escape("".join(sorted(SEPARATORS))) + r"])"
+        r"|(?P<OP>" + _OP_RE.pattern + r")"
+        r"|(?P<BAD>.)"
+    )
+    _MASTER_RE: Final = re.compile(_MASTER_PATTERN, re.DOTALL)
+    # No second re.ASCII (or bytes) compile for ASCII sources: it speeds up
+    # the bare match loop by ~12% but is lost in the noise of tokenize()
+
+    _CHAR_KIND: Final = _char_kind_table(SEPARATORS, OPERATORS)
+
+    # Fixed parts of lexical_table(), sorted once
+    _SORTED_KEYWORDS: Final = sorted(KEYWORDS)
+    _SORTED_SEPARATORS: Final = sorted(SEPARATORS)
+
+    # One shared, interned object per keyword/operator/separator spelling;
+    # emitted token values point at these instead of fresh slices
+    _CANON: Final[Dict[str, str]] = {w: sys.intern(w) for w in [*KEYWORDS, *OPERATORS, *SEPARATORS]}
 
     def __init__(self, source: str):
-        self.source = source
-        self.i = 0
-        self.line = 1
-        self.col = 1
+        # trailing "\0" sentinel: source[i] is always valid up to and
+        # including _end, so the helpers index directly instead of peek()
+        self.source: str = source + "\0"
+        # as in the original peek()-driven loop, an embedded "\0" ends the input
+        nul = source.find("\0")
+        self._end: int = len(source) if nul == -1 else nul
+        self.i: int = 0
+        self.line: int = 1
+        self.col: int = 1
 
         # Simple "Lexical Table" (symbol tables for later compiler phases)
-        self.identifiers: Set[str] = set()
-        self.constants: Set[str] = set()
+        # dicts used as insertion-ordered sets (values are always None)
+        self.identifiers: Dict[str, None] = {}
+        self.constants: Dict[str, None] = {}
+        self._table: Optional[Dict[str, Any]] = None  # lexical_table() cache
 
     # ---------- helpers ----------
     def peek(self, k: int = 0) -> str:
         j = self.i + k
-        return self.source[j] if j < len(self.source) else "\0"
+        return self.source[j] if j < self._end else "\0"
 
     def advance(self) -> str:
-        ch = self.peek()
+        ch = self.source[self.i]
         self.i += 1
         if ch == "\n":
             self.line += 1
@@ -79,8 +237,17 @@ class Lexer:
             self.col += 1
         return ch
 
-    def startswith(self, s: str) -> bool:
-        return all(self.peek(k) == s[k] for k in range(len(s)))
+    def advance_to(self, j: int) -> None:
+        """
+        Jump to index j, updating line/col as advance() would have.
+        """
+        nl = self.source.count("\n", self.i, j)
+        if nl:
+            self.line += nl
+            self.col = j - self.source.rfind("\n", self.i, j)
+        else:
+            self.col += j - self.i
+        self.i = j
 
     def token(self, ttype: str, value: str, line: int, col: int) -> Token:
         return Token(ttype, value, line, col)
@@ -88,14 +255,18 @@ class Lexer:
     # ---------- lexing ----------
     def lex_identifier_or_keyword(self) -> Token:
         line, col = self.line, self.col
-        s = ""
-        while self.peek().isalnum() or self.peek() == "_":
-            s += self.advance()
-
-        if s in self.KEYWORDS:
-            return self.token("KW", s, line, col)
-
-        self.identifiers.add(s)  # lexical table entry
+        m = Lexer._IDENT_RE.match(self.source, self.i)
+        assert m is not None  # \w* always matches
+        s = m.group()
+        # identifiers never contain "\n", so only the column moves
+        self.col += len(s)
+        self.i = m.end()
+
+        if self._KW_LEN_MIN <= len(s) <= self._KW_LEN_MAX and s in self.KEYWORDS:
+            return self.token("KW", self._CANON[s], line, col)
+
+        self.identifiers[s] = None  # lexical table entry
+        self._table = None
         return self.token("IDENT", s, line, col)
 
     def lex_number(self) -> Token:
@@ -106,36 +277,17 @@ class Lexer:
         - SCI: 5.1e3, 1e-2, 2.0E+5
         """
         line, col = self.line, self.col
-        s = ""
-
-        # integer part
-        while self.peek().isdigit():
-            s += self.advance()
-
-        is_float = False
-
-        # fractional part
-        if self.peek() == "." and self.peek(1).isdigit():
-            is_float = True
-            s += self.advance()  # '.'
-            while self.peek().isdigit():
-                s += self.advance()
-
-        # scientific notation part
-        if self.peek() in ("e", "E"):
-            # only treat as sci-notation if followed by digit or sign+digit
-            nxt = self.peek(1)
-            nxt2 = self.peek(2)
-            if nxt.isdigit() or (nxt in "+-" and nxt2.isdigit()):
-                is_float = True
-                s += self.advance()  # e/E
-                if self.peek() in "+-":
-                    s += self.advance()
-                while self.peek().isdigit():
-                    s += self.advance()
+        m = Lexer._NUM_RE.match(self.source, self.i)
+        if m is None:
+            raise LexerError(f"Expected a number at {self.line}:{self.col}")
+        s = m.group()
+        is_float = "." in s or "e" in s or "E" in s
+        self.col += len(s)
+        self.i = m.end()
 
         ttype = "FLOAT" if is_float else "INT"
-        self.constants.add(s)  # lexical table entry
+        self.constants[s] = None  # lexical table entry
+        self._table = None
         return self.token(ttype, s, line, col)
 
     def lex_string(self) -> Token:
@@ -145,124 +297,289 @@ class Lexer:
         - '' inside single quotes becomes literal '
         - escapes: \n, \t, \\, \', \"
         """
-        quote = self.peek()
+        line, col = self.line, self.col
+        return self.token("STRING", self._lex_string_value(), line, col)
+
+    def _lex_string_value(self) -> str:
+        """
+        Body of lex_string(): consumes the literal, records it in the lexical
+        table and returns its decoded value without building a Token.
+        """
+        quote = self.source[self.i]
         line, col = self.line, self.col
         self.advance()  # opening quote
+        body = Lexer._STR_BODY[quote]
+
+        # fast path: nothing to unescape before the closing quote (no "\\",
+        # no ''), so the value is a single slice of the source
+        m = body.match(self.source, self.i)
+        assert m is not None  # [^...]* always matches
+        end = m.end()
+        if self.source[end] == quote and not (quote == "'" and self.source[end + 1] == "'"):
+            out = m.group()
+            self.advance_to(end + 1)  # body + closing quote
+        else:
+            self.advance_to(end)
+            out = self._lex_escaped_string_body(quote, line, col, m.group())
+
+        self.constants[out] = None  # lexical table entry (string literal)
+        self._table = None
+        return out
 
-        out = ""
+    def _lex_escaped_string_body(self, quote: str, line: int, col: int, head: str) -> str:
+        """
+        Slow path of lex_string(): head is the run already scanned up to the
+        first escape/quote; decodes the rest through the closing quote.
+        """
+        body = Lexer._STR_BODY[quote]
+
+        # pieces are joined once at the end instead of growing a str
+        parts: List[str] = [head]
         while True:
-            ch = self.peek()
+            # self.i is on the quote, a "\\" or the "\0" sentinel
+            ch = self.source[self.i]
 
             if ch == "\0":
                 raise LexerError(f"Unterminated string at {line}:{col}")
 
             if ch == quote:
-                if quote == "'" and self.peek(1) == "'":  # '' => literal '
+                if quote == "'" and self.source[self.i + 1] == "'":  # '' => literal '
                     self.advance(); self.advance()
-                    out += "'"
-                    continue
-                self.advance()  # closing quote
-                break
+                    parts.append("'")
+                else:
+                    self.advance()  # closing quote
+                    break
 
-            if ch == "\\":
+            else:  # "\\"
                 self.advance()
-                esc = self.peek()
-                escapes = {"n": "\n", "t": "\t", "\\": "\\", "'": "'", '"': '"'}
-                if esc in escapes:
-                    out += escapes[esc]
+                esc = self.source[self.i]
+                if esc in self.ESCAPES:
+                    parts.append(self.ESCAPES[esc])
                     self.advance()
-                else:
-                    out += "\\" + self.advance()
-                continue
+                elif self.i < self._end:  # at the sentinel: reported above
+                    parts.append("\\" + self.advance())
 
-            out += self.advance()
+            # copy the run up to the next quote/escape in one slice
+            m = body.match(self.source, self.i)
+            assert m is not None  # [^...]* always matches
+            parts.append(m.group())
+            self.advance_to(m.end())
 
-        self.constants.add(out)  # lexical table entry (string literal)
-        return self.token("STRING", out, line, col)
+        return "".join(parts)
 
     def lex_operator(self) -> Optional[Token]:
         line, col = self.line, self.col
-        for op in self.OPERATORS:
-            if all(self.peek(k) == op[k] for k in range(len(op))):
-                for _ in range(len(op)):
-                    self.advance()
-                return self.token("OP", op, line, col)
+        for op in Lexer._OP_BY_FIRST.get(self.source[self.i], ()):
+            if self.source.startswith(op, self.i):
+                # operators never contain "\n", so only the column moves
+                self.i += len(op)
+                self.col += len(op)
+                return self.token("OP", self._CANON[op], line, col)
         return None
 
     def skip_comment_if_present(self) -> bool:
-        if self.startswith(self.LINE_COMMENT):
-            while self.peek() not in ("\n", "\0"):
-                self.advance()
+        if self.source.startswith(self.LINE_COMMENT, self.i):
+            # jump to end of line; the "\n" itself is left for tokenize()
+            nl = self.source.find("\n", self.i, self._end)
+            if nl == -1:
+                nl = self._end
+            self.col += nl - self.i
+            self.i = nl
             return True
 
-        if self.startswith(self.BLOCK_COMMENT_START):
+        if self.source.startswith(self.BLOCK_COMMENT_START, self.i):
             self.advance(); self.advance()  # consume /*
-            while True:
-                if self.peek() == "\0":
-                    raise LexerError(f"Unterminated block comment at {self.line}:{self.col}")
-                if self.startswith(self.BLOCK_COMMENT_END):
-                    self.advance(); self.advance()  # consume */
-                    return True
-                self.advance()
+            end = self.source.find(self.BLOCK_COMMENT_END, self.i, self._end)
+            if end == -1:
+                self.advance_to(self._end)
+                raise LexerError(f"Unterminated block comment at {self.line}:{self.col}")
+            self.advance_to(end + len(self.BLOCK_COMMENT_END))  # consume body + */
+            return True
         return False
 
-    def tokenize(self) -> List[Token]:
-        tokens: List[Token] = []
-
-        while self.peek() != "\0":
-            ch = self.peek()
-
-            if ch.isspace():
-                self.advance()
-                continue
-
-            # strings first
-            if ch in ("'", '"'):
-                tokens.append(self.lex_string())
-                continue
+    def _add_token(self, ts: TokenStream, kind: int, value: str, line: int, col: int) -> None:
+        """
+        Appends an identifier/keyword, separator, operator or number token
+        to ts, given its kind and source text, and records identifiers and
+        numbers in the lexical table.  Shared by tokenize_soa() and
+        fast_tokenize().
+        """
+        if kind == _K_ID:
+            if Lexer._KW_LEN_MIN <= len(value) <= Lexer._KW_LEN_MAX and value in Lexer.KEYWORDS:
+                ttype = "KW"
+                value = Lexer._CANON[value]
+            else:
+                self.identifiers[value] = None  # lexical table entry
+                ttype = "IDENT"
+        elif kind == _K_SEP:
+            # one-character strings are CPython's cached singletons,
+            # so this is already canonical without a _CANON lookup
+            ttype = "SEP"
+        elif kind == _K_OP:
+            ttype = "OP"
+            value = Lexer._CANON[value]
+        else:
+            is_float = "." in value or "e" in value or "E" in value
+            self.constants[value] = None  # lexical table entry
+            ttype = "FLOAT" if is_float else "INT"
+        # token type strings are code constants, hence already interned:
+        # `types` holds pointer-equal objects
+        ts.types.append(ttype)
+        ts.values.append(value)
+        ts.lines.append(line)
+        ts.cols.append(col)
 
-            # comments
-            if self.skip_comment_if_present():
-                continue
+    def tokenize(self) -> List[Token]:
+        return self.tokenize_soa().tokens()
 
-            # numbers
-            if ch.isdigit():
-                tokens.append(self.lex_number())
+    def tokenize_soa(self) -> TokenStream:
+        """
+        Same tokens as tokenize(), stored as parallel arrays (no Token objects).
+        """
+        src = self.source
+        n = self._end
+        ts = TokenStream([], [], array("i"), array("i"))
+        self._table = None  # identifiers/constants are about to change
+
+        # hot-loop names bound once as locals (LOAD_FAST instead of LOAD_ATTR)
+        add_type = ts.types.append
+        add_value = ts.values.append
+        add_line = ts.lines.append
+        add_col = ts.cols.append
+        add_token = self._add_token
+        char_kind = Lexer._CHAR_KIND
+        # the kind table only sends a position to a pattern that matches there
+        ws = cast(_Matcher, Lexer._WS_RE.match)
+        ident = cast(_Matcher, Lexer._IDENT_RE.match)
+        num = cast(_Matcher, Lexer._NUM_RE.match)
+        op = cast(_Matcher, Lexer._OP_RE.match)
+        master = cast(_Matcher, Lexer._MASTER_RE.match)
+
+        # line/col are derived from the index of the current line's start,
+        # which is only moved by spans that can contain "\n"
+        pos = self.i
+        line = self.line
+        line_start = pos - self.col + 1
+
+        while pos < n:
+            # the first character picks the kind; only the ambiguous ones
+            # pay for trying every alternative of the master pattern
+            o = ord(src[pos])
+            kind = char_kind[o] if o < 128 else 0
+            m: Optional[re.Match[str]] = None
+            if kind == 0:
+                m = master(src, pos, n)  # n: never run into the sentinel
+                kind = m.lastindex or _K_BAD  # BAD is the catch-all anyway
+                # [^\W\d] also admits non-decimal numerics such as "²" or
+                # "ⅷ"; identifiers must start like isalpha() or "_"
+                if kind == _K_ID and not (src[pos].isalpha() or src[pos] == "_"):
+                    kind = _K_BAD
+            col = pos - line_start + 1
+
+            if kind <= _K_BCOM:  # whitespace and comments
+                end = (m or ws(src, pos)).end()
+                nl = src.count("\n", pos, end)
+                if nl:
+                    line += nl
+                    line_start = src.rfind("\n", pos, end) + 1
+                pos = end
                 continue
 
-            # identifiers/keywords
-            if ch.isalpha() or ch == "_":
-                tokens.append(self.lex_identifier_or_keyword())
+            if kind == _K_SEP:
+                # the most common token, and nothing to look up: kept inline
+                add_type("SEP")
+                add_value(src[pos])
+                add_line(line)
+                add_col(col)
+                pos += 1
                 continue
 
-            # separators
-            if ch in self.SEPARATORS:
-                line, col = self.line, self.col
-                tokens.append(self.token("SEP", self.advance(), line, col))
+            if kind == _K_ID:
+                m = m or ident(src, pos)
+            elif kind == _K_OP:
+                m = m or op(src, pos)
+            elif kind == _K_NUM:
+                m = m or num(src, pos)
+            else:
+                # strings and errors go through the character-level helpers
+                self.i, self.line, self.col = pos, line, col
+                if kind == _K_STR:
+                    add_type("STRING")
+                    add_value(self._lex_string_value())
+                    add_line(line)
+                    add_col(col)
+                elif kind == _K_BADCOM:
+                    self.skip_comment_if_present()  # raises: no closing */
+                else:
+                    raise LexerError(f"Unexpected character {src[pos]!r} at {line}:{col}")
+                pos, line = self.i, self.line
+                line_start = pos - self.col + 1
                 continue
 
-            # operators
-            op = self.lex_operator()
-            if op is not None:
-                tokens.append(op)
-                continue
+            add_token(ts, kind, m.group(), line, col)
+            pos = m.end()
 
-            raise LexerError(f"Unexpected character {ch!r} at {self.line}:{self.col}")
+        self.i, self.line, self.col = pos, line, pos - line_start + 1
+        add_type("EOF")
+        add_value("")
+        add_line(self.line)
+        add_col(self.col)
+        return ts
 
-        tokens.append(self.token("EOF", "", self.line, self.col))
-        return tokens
+    def fast_tokenize(self) -> List[Token]:
+        """
+        tokenize() with the scanning loop run by the Numba kernel in
+        numba_scan.py; only the token values are built here.  Falls back to
+        tokenize() when numpy/numba are missing, the source is not ASCII or
+        the lexer is not at the start of its input, and reruns it on a
+        lexical error so the usual LexerError is raised.
+        """
+        numba_scan = _numba_scan()
+        src = self.source
+        if numba_scan is None or self.i != 0 or not src.isascii():
+            return self.tokenize()
+        scanned = numba_scan.scan(src, self._end)
+        if scanned is None:
+            return self.tokenize()
+        kinds, starts, ends, lines, cols, eof_line, eof_col = scanned
+
+        ts = TokenStream([], [], array("i"), array("i"))
+        add_token = self._add_token
+        self._table = None  # identifiers/constants are about to change
+
+        for kind, start, end, line, col in zip(kinds, starts, ends, lines, cols):
+            if kind == _K_STR:
+                # escapes and '' are decoded by the usual helper
+                self.i, self.line, self.col = start, line, col
+                ts.types.append("STRING")
+                ts.values.append(self._lex_string_value())
+                ts.lines.append(line)
+                ts.cols.append(col)
+            else:
+                add_token(ts, kind, src[start:end], line, col)
+
+        self.i, self.line, self.col = self._end, eof_line, eof_col
+        ts.types.append("EOF")
+        ts.values.append("")
+        ts.lines.append(eof_line)
+        ts.cols.append(eof_col)
+        return ts.tokens()
 
     def lexical_table(self) -> Dict[str, Any]:
         """
         Returns a simple lexical table (for your report / later phases).
+        The sorted lists are cached until more input is lexed; each call
+        returns fresh copies, so callers may modify them.
         """
-        return {
-            "identifiers": sorted(self.identifiers),
-            "constants": sorted(self.constants),
-            "keywords": sorted(self.KEYWORDS),
-            "operators": self.OPERATORS[:],
-            "separators": sorted(self.SEPARATORS),
-        }
+        if self._table is None:
+            self._table = {
+                "identifiers": sorted(self.identifiers),
+                "constants": sorted(self.constants),
+                "keywords": self._SORTED_KEYWORDS,
+                "operators": self.OPERATORS,
+                "separators": self._SORTED_SEPARATORS,
+            }
+        return {name: entries[:] for name, entries in self._table.items()}
 
 
 # =========================
@@ -0,0 +1,180 @@
+"""
+Numba kernel behind Lexer.fast_tokenize() (optional: needs numpy + numba).
+
+_scan() walks an ASCII source as uint8 codes and records, for every token,
+its kind (final._K_* codes), [start, end) span and line/col.  Turning the
+spans into Token objects (keywords, lexical table, string escapes) stays in
+final.py; any lexical error is reported back so the caller can rerun the
+pure-Python lexer and raise the usual LexerError.
+"""
+from __future__ import annotations
+from typing import List, Optional, Tuple
+
+import numpy as np
+from numba import njit  # type: ignore[import-untyped, unused-ignore]  # older numba has no py.typed
+
+from final import Lexer, _K_WS, _K_STR, _K_NUM, _K_ID, _K_SEP, _K_OP
+
+
+# =========================
+# Lookup tables (built once from the Lexer definitions)
+# =========================
+_CHAR_KIND = np.array(Lexer._CHAR_KIND, dtype=np.uint8)
+
+# OPERATORS as a zero-padded byte matrix, in Lexer's longest-first order
+_OP_LENS = np.array([len(op) for op in Lexer.OPERATORS], dtype=np.int32)
+_OPS = np.zeros((len(Lexer.OPERATORS), int(_OP_LENS.max())), dtype=np.uint8)
+for _k, _op in enumerate(Lexer.OPERATORS):
+    _OPS[_k, :len(_op)] = np.frombuffer(_op.encode("ascii"), dtype=np.uint8)
+del _k, _op
+
+_NL, _QUOTE, _BACKSLASH, _SLASH, _STAR = 10, 39, 92, 47, 42
+
+
+# =========================
+# Kernel
+# =========================
+@njit(cache=True)
+def _is_digit(c):  # type: ignore[no-untyped-def]
+    return 48 <= c <= 57
+
+
+@njit(cache=True)
+def _scan(buf, n, char_kind, ops, op_lens):  # type: ignore[no-untyped-def]
+    """
+    buf holds n source bytes plus the "\\0" sentinel, so buf[i + 1] is always
+    readable while i < n.  Returns (kinds, starts, ends, lines, cols, count,
+    eof_line, eof_col); count is -1 on a lexical error.
+    """
+    kinds = np.empty(n + 1, np.int32)
+    starts = np.empty(n + 1, np.int32)
+    ends = np.empty(n + 1, np.int32)
+    lines = np.empty(n + 1, np.int32)
+    cols = np.empty(n + 1, np.int32)
+    count = 0
+    line = 1
+    line_start = 0
+    i = 0
+
+    while i < n:
+        c = buf[i]
+        kind = char_kind[c]
+        start = i
+        tok_line = line
+        col = i - line_start + 1
+
+        if kind == _K_WS:
+            while i < n and char_kind[buf[i]] == _K_WS:
+                if buf[i] == _NL:
+                    line += 1
+                    line_start = i + 1
+                i += 1
+            continue
+
+        elif kind == _K_ID:
+            i += 1
+            while char_kind[buf[i]] == _K_ID or char_kind[buf[i]] == _K_NUM:
+                i += 1
+
+        elif kind == _K_NUM:
+            while _is_digit(buf[i]):
+                i += 1
+            # fractional part
+            if buf[i] == 46 and _is_digit(buf[i + 1]):
+                i += 1
+                while _is_digit(buf[i]):
+                    i += 1
+            # scientific notation only if followed by digit or sign+digit
+            if buf[i] == 101 or buf[i] == 69:
+                j = i + 1
+                if buf[j] == 43 or buf[j] == 45:
+                    j += 1
+                if _is_digit(buf[j]):
+                    i = j
+                    while _is_digit(buf[i]):
+                        i += 1
+
+        elif kind == _K_SEP:
+            i += 1
+
+        elif kind == _K_STR:
+            i += 1
+            while True:
+                if i >= n or buf[i] == 0:
+                    return kinds, starts, ends, lines, cols, -1, line, 0
+                d = buf[i]
+                if d == c:
+                    if c == _QUOTE and buf[i + 1] == _QUOTE:  # '' => literal '
+                        i += 2
+                        continue
+                    i += 1
+                    break
+                if d == _BACKSLASH:
+                    if i + 1 >= n:
+                        return kinds, starts, ends, lines, cols, -1, line, 0
+                    if buf[i + 1] == _NL:
+                        line += 1
+                        line_start = i + 2
+                    i += 2
+                    continue
+                if d == _NL:
+                    line += 1
+                    line_start = i + 1
+                i += 1
+
+        elif c == _SLASH and buf[i + 1] == _SLASH:
+            while i < n and buf[i] != _NL:
+                i += 1
+            continue
+
+        elif c == _SLASH and buf[i + 1] == _STAR:
+            i += 2
+            while i < n and not (buf[i] == _STAR and buf[i + 1] == _SLASH):
+                if buf[i] == _NL:
+                    line += 1
+                    line_start = i + 1
+                i += 1
+            if i >= n:
+                return kinds, starts, ends, lines, cols, -1, line, 0
+            i += 2
+            continue
+
+        else:
+            # operators, longest first; op bytes are never 0, so a mismatch
+            # on the sentinel stops the compare before running off buf
+            matched = 0
+            for k in range(ops.shape[0]):
+                length = op_lens[k]
+                t = 0
+                while t < length and buf[i + t] == ops[k, t]:
+                    t += 1
+                if t == length:
+                    matched = length
+                    break
+            if matched == 0:
+                return kinds, starts, ends, lines, cols, -1, line, 0
+            kind = _K_OP
+            i += matched
+
+        kinds[count] = kind
+        starts[count] = start
+        ends[count] = i
+        lines[count] = tok_line
+        cols[count] = col
+        count += 1
+
+    return kinds, starts, ends, lines, cols, count, line, n - line_start + 1
+
+
+def scan(source: str, end: int) -> Optional[Tuple[List[int], List[int], List[int], List[int], List[int], int, int]]:
+    """
+    Scans source[:end] (source must be ASCII and end with the "\\0" sentinel).
+    Returns (kinds, starts, ends, lines, cols, eof_line, eof_col) as Python
+    lists/ints, or None if the source has a lexical error.
+    """
+    buf = np.frombuffer(source.encode("ascii"), dtype=np.uint8)
+    kinds, starts, ends, lines, cols, count, eof_line, eof_col = _scan(buf, end, _CHAR_KIND, _OPS, _OP_LENS)
+    if count < 0:
+        return None
+    return (kinds[:count].tolist(), starts[:count].tolist(), ends[:count].tolist(),
+            lines[:count].tolist(), cols[:count].tolist(), eof_line, eof_col)
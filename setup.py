@@ -0,0 +1,19 @@
+"""
+Optional compiled build of the lexer.
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+This puts a mypyc-compiled final.*.so next to final.py; `import final`
+picks it up automatically, and deleting it falls back to the pure-Python
+module.
+"""
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="cs453-lexer",
+    py_modules=["final", "numba_scan"],
+    python_requires=">=3.10",  # Token uses @dataclass(slots=True)
+    ext_modules=mypycify(["final.py"]),
+)
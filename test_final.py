@@ -0,0 +1,141 @@
+import importlib.util
+import unittest
+
+from final import Lexer, LexerError
+
+
+def lex(source):
+    return [(t.type, t.value, t.line, t.col) for t in Lexer(source).tokenize()]
+
+
+class UnicodeStartTest(unittest.TestCase):
+    def test_non_decimal_numerics_are_not_identifiers(self):
+        for source in ("ⅷ", "²", "1²"):
+            with self.subTest(source=source):
+                with self.assertRaisesRegex(LexerError, "Unexpected character"):
+                    Lexer(source).tokenize()
+
+    def test_unicode_letters_start_identifiers(self):
+        self.assertEqual(lex("é x1"), [
+            ("IDENT", "é", 1, 1), ("IDENT", "x1", 1, 3), ("EOF", "", 1, 5),
+        ])
+
+
+class EmbeddedNulTest(unittest.TestCase):
+    # the first "\0" is end of input, as in the original peek()-driven loop
+    def test_nul_ends_input(self):
+        self.assertEqual(lex("a\0b"), [("IDENT", "a", 1, 1), ("EOF", "", 1, 2)])
+        self.assertEqual(lex("x // c\0\ny"), [("IDENT", "x", 1, 1), ("EOF", "", 1, 7)])
+
+    def test_nul_inside_string_or_comment_is_unterminated(self):
+        with self.assertRaisesRegex(LexerError, "Unterminated string at 1:1"):
+            Lexer('"a\0b"').tokenize()
+        with self.assertRaisesRegex(LexerError, "Unterminated block comment at 1:5"):
+            Lexer("/* a\0 */").tokenize()
+
+
+class StringLiteralTest(unittest.TestCase):
+    # a literal is taken as one slice unless its body stops at a backslash
+    # or at a '' pair; these cases sit right on that decision
+    def test_doubled_single_quote_after_the_body(self):
+        self.assertEqual(lex("'a'''"), [("STRING", "a'", 1, 1), ("EOF", "", 1, 6)])
+        self.assertEqual(lex("'ab'''''"), [("STRING", "ab''", 1, 1), ("EOF", "", 1, 9)])
+
+    def test_empty_literals(self):
+        self.assertEqual(lex("''"), [("STRING", "", 1, 1), ("EOF", "", 1, 3)])
+        self.assertEqual(lex("'' 'b'"), [
+            ("STRING", "", 1, 1), ("STRING", "b", 1, 4), ("EOF", "", 1, 7),
+        ])
+
+    def test_doubled_double_quote_is_two_literals(self):
+        self.assertEqual(lex('"a""b"'), [
+            ("STRING", "a", 1, 1), ("STRING", "b", 1, 4), ("EOF", "", 1, 7),
+        ])
+
+    def test_backslash_before_the_closing_quote(self):
+        self.assertEqual(lex('"a\\""'), [("STRING", 'a"', 1, 1), ("EOF", "", 1, 6)])
+        self.assertEqual(lex('"a\\\\"'), [("STRING", "a\\", 1, 1), ("EOF", "", 1, 6)])
+        with self.assertRaisesRegex(LexerError, "Unterminated string at 1:1"):
+            Lexer('"a\\"').tokenize()
+
+
+class TokenizeSoaTest(unittest.TestCase):
+    def test_matches_tokenize_field_by_field(self):
+        source = "let s = 'it''s' + \"a\\tb\";\nif (s != null) { print(s.len, 2, 1.5e3); } // done"
+        tokens = Lexer(source).tokenize()
+        ts = Lexer(source).tokenize_soa()
+        self.assertEqual(len(ts), len(tokens))
+        self.assertEqual(ts.types, [t.type for t in tokens])
+        self.assertEqual(ts.values, [t.value for t in tokens])
+        self.assertEqual(list(ts.lines), [t.line for t in tokens])
+        self.assertEqual(list(ts.cols), [t.col for t in tokens])
+        self.assertEqual(ts.tokens(), tokens)
+        for ttype in ("KW", "IDENT", "STRING", "INT", "FLOAT", "OP", "SEP", "EOF"):
+            self.assertIn(ttype, ts.types)
+        self.assertIn("it's", ts.values)
+        self.assertIn("a\tb", ts.values)
+
+    def test_lexical_table_matches_tokenize(self):
+        source = "let x = 'v'; y = 2"
+        a, b = Lexer(source), Lexer(source)
+        a.tokenize()
+        b.tokenize_soa()
+        self.assertEqual(a.lexical_table(), b.lexical_table())
+
+
+class LexicalTableTest(unittest.TestCase):
+    def test_cache_is_invalidated_by_lexing(self):
+        lexer = Lexer("a = 1; b = 'c'")
+        self.assertEqual(lexer.lexical_table()["identifiers"], [])
+        lexer.tokenize()
+        table = lexer.lexical_table()
+        self.assertEqual(table["identifiers"], ["a", "b"])
+        self.assertEqual(table["constants"], ["1", "c"])
+
+    def test_callers_cannot_modify_the_cache(self):
+        lexer = Lexer("x = 1")
+        lexer.tokenize()
+        table = lexer.lexical_table()
+        for entries in table.values():
+            entries.append("zzz")
+        table["identifiers"] = []
+        self.assertEqual(lexer.lexical_table()["identifiers"], ["x"])
+        self.assertNotIn("zzz", lexer.lexical_table()["keywords"])
+        self.assertEqual(Lexer("").lexical_table()["operators"], Lexer.OPERATORS)
+        self.assertNotIn("zzz", Lexer.OPERATORS)
+
+
+def lex_with(method, source):
+    lexer = Lexer(source)
+    try:
+        tokens = getattr(lexer, method)()
+    except LexerError as e:
+        return str(e)
+    return [(t.type, t.value, t.line, t.col) for t in tokens], lexer.lexical_table()
+
+
+@unittest.skipUnless(importlib.util.find_spec("numba"), "numba is not installed")
+class FastTokenizeTest(unittest.TestCase):
+    SOURCES = [
+        "let x = 1.5e3; // done\nprint(x);",
+        "fn f(a, b) { return a >= b && !(a === b) || a != 0; }",
+        '"tab\\t nl\\n q\\" bs\\\\ other\\q"',
+        "'it''s' ''",
+        '"line\\\nnext" x',
+        "a /* one\ntwo */ b",
+        "a /* never closed",
+        '"never closed',
+        "x @ y",
+        "a & b",
+        "1.e5 2e+ 3.x",
+        "",
+    ]
+
+    def test_matches_tokenize(self):
+        for source in self.SOURCES:
+            with self.subTest(source=source):
+                self.assertEqual(lex_with("fast_tokenize", source), lex_with("tokenize", source))
+
+
+if __name__ == "__main__":
+    unittest.main()